@@ -3,11 +3,11 @@
 # Author: Your Name
 # Description: A Python-based CLI tool for generating React dashboards from YAML configurations or interactively. It can also purge existing dashboard projects.
 
+import argparse
+import functools
 import os
-import shutil
-import importlib
-import subprocess
 import sys
+import zlib
 
 # Required packages for dependencies
 REQUIRED_PACKAGES = [
@@ -20,30 +20,134 @@ PROJECT_STRUCTURE = {
     "src": ["components", "layouts", "pages", "services", "themes", "utils", "mockData"]
 }
 
+# Project directories relative to the project root, each parent listed before its subfolders
+PROJECT_DIRECTORIES = tuple(
+    path
+    for folder, subfolders in PROJECT_STRUCTURE.items()
+    for path in [folder] + [os.path.join(folder, subfolder) for subfolder in subfolders]
+)
+
+# React entry point (pre-encoded, written verbatim)
+INDEX_JS_CONTENT = b"""
+import React from 'react';
+import ReactDOM from 'react-dom';
+import App from './App';
+
+ReactDOM.render(
+    <React.StrictMode>
+        <App />
+    </React.StrictMode>,
+    document.getElementById('root')
+);
+    """
+
+# React app wrapper (pre-encoded, written verbatim)
+APP_JS_CONTENT = b"""
+import React from 'react';
+import './App.css';
+import ThemeProvider from '@mui/material/styles/ThemeProvider';
+import theme from './themes/theme';
+
+function App() {
+    return (
+        <ThemeProvider theme={theme}>
+            <div>
+                <h1>Welcome to DashCraft!</h1>
+                <p>Your dashboard is ready to go.</p>
+            </div>
+        </ThemeProvider>
+    );
+}
+
+export default App;
+    """
+
+# Package.json for the generated React application (pre-encoded, written verbatim)
+PACKAGE_JSON_CONTENT = b"""
+{
+  "name": "dashcraft-app",
+  "version": "1.0.0",
+  "private": true,
+  "dependencies": {
+    "@mui/material": "^5.0.0",
+    "@emotion/react": "^11.0.0",
+    "@emotion/styled": "^11.0.0",
+    "react": "^18.0.0",
+    "react-dom": "^18.0.0",
+    "react-scripts": "5.0.0"
+  },
+  "scripts": {
+    "start": "react-scripts start",
+    "build": "react-scripts build",
+    "test": "react-scripts test",
+    "eject": "react-scripts eject"
+  }
+}
+    """
+
+# Minimum number of files before generation is spread across worker threads
+PARALLEL_WRITE_THRESHOLD = 16
+
+# Worker threads used to delete node_modules when purging a dashboard
+PURGE_WORKERS = 32
+
 # Global flag for dependency resolution
 dependencies_checked = False
 
+# Dependency Check Cache
+def dependency_marker_path():
+    """
+    Returns the path of the marker file recording a successful dependency check.
+    The file name is keyed on the interpreter and REQUIRED_PACKAGES, so a new
+    environment or a change in requirements triggers a fresh check.
+    """
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = zlib.crc32(repr((sys.executable, REQUIRED_PACKAGES)).encode())
+    return os.path.join(cache_dir, "dashcraft", f"deps-{key:08x}.ok")
+
+def reset_dependency_check():
+    """
+    Forgets any recorded dependency check, so the next call to
+    check_and_resolve_dependencies() probes the packages again.
+    """
+    global dependencies_checked
+    dependencies_checked = False
+    try:
+        os.remove(dependency_marker_path())
+    except OSError:
+        pass
+
 # Dependency Checker
 def check_and_resolve_dependencies():
     """
     Checks if required dependencies are installed. If not, prompts the user
-    to install them interactively. This function runs only once per execution.
+    to install them interactively, or exits when stdin is not a terminal. This function runs only once per execution,
+    and is skipped entirely once a previous run has recorded a successful check.
+    load_yaml() resets a stale record if the packages have since been removed.
     """
     global dependencies_checked
     if dependencies_checked:
         return
 
+    marker = dependency_marker_path()
+    if os.path.exists(marker):
+        dependencies_checked = True
+        return
+
+    from importlib import util
+
     missing_packages = []
 
-    # Check each required package
+    # Check each required package without executing it; load_yaml imports yaml when needed
     for package in REQUIRED_PACKAGES:
-        try:
-            importlib.import_module(package["import_name"])
-        except ImportError:
+        if util.find_spec(package["import_name"]) is None:
             missing_packages.append(package["name"])
 
     if missing_packages:
         print(f"Missing dependencies: {', '.join(missing_packages)}")
+        if not sys.stdin.isatty():
+            print(f"Install them with '{sys.executable} -m pip install {' '.join(missing_packages)}' and run DashCraft again.")
+            sys.exit(1)
         choice = input("Do you want to install the missing dependencies? (yes/no): ").strip().lower()
         if choice in ["yes", "y"]:
             for package in missing_packages:
@@ -53,14 +157,23 @@ def check_and_resolve_dependencies():
             sys.exit(1)
 
     dependencies_checked = True
+    try:
+        os.makedirs(os.path.dirname(marker), exist_ok=True)
+        open(marker, "w").close()
+    except OSError:
+        pass  # Caching is best-effort; the check simply runs again next time
     print("All dependencies are satisfied. You're ready to run DashCraft!")
 
 def install_package(package_name):
     """
     Installs a Python package using pip.
     """
+    import importlib
+    import subprocess
+
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
+        importlib.invalidate_caches()  # Make the new package importable in this process
         print(f"Successfully installed {package_name}.")
     except Exception as e:
         print(f"Failed to install {package_name}: {e}")
@@ -74,34 +187,92 @@ def load_yaml(file_path):
     :return: Parsed YAML content as a dictionary
     """
     try:
-        import yaml
-        with open(file_path, "r") as file:
-            return yaml.safe_load(file)
+        try:
+            import yaml
+        except ImportError:
+            # A recorded dependency check is stale (e.g. pyyaml was uninstalled since)
+            reset_dependency_check()
+            check_and_resolve_dependencies()
+            import yaml
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+            print("Note: PyYAML was built without libyaml; using the slower pure-Python loader.")
+        # Binary mode lets the loader consume the raw bytes without a separate decode pass
+        with open(file_path, "rb") as file:
+            return yaml.load(file, Loader=Loader)
     except Exception as e:
         print(f"Error reading YAML file: {e}")
         return None
 
 # Project Structure Generator
-def create_project_structure(base_dir, structure):
+def create_project_structure(base_dir, directories=PROJECT_DIRECTORIES):
     """
     Creates the directory structure for a dashboard project.
     :param base_dir: The base directory for the project
-    :param structure: A dictionary defining folder names and subfolders
+    :param directories: Relative directory paths, each parent before its subfolders
     """
-    for folder, subfolders in structure.items():
-        folder_path = os.path.join(base_dir, folder)
-        os.makedirs(folder_path, exist_ok=True)
-        for subfolder in subfolders:
-            os.makedirs(os.path.join(folder_path, subfolder), exist_ok=True)
+    # Only the base directory may need intermediate parents; every other folder
+    # is created with a single mkdir.
+    os.makedirs(base_dir, exist_ok=True)
+    for directory in directories:
+        path = os.path.join(base_dir, directory)
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
 
-# React Component Generator
-def generate_component(component, output_dir):
+# File Writer
+def write_file(file_path, data):
     """
-    Generates a React component file based on the component configuration.
-    :param component: Dictionary defining the component (type, id, options)
-    :param output_dir: Base output directory for the React project
+    Writes bytes to a file atomically. The data goes to a temporary file in the
+    same directory which then replaces the target, so concurrent runs against
+    the same output directory never leave partially written files behind.
+    Files whose contents already match are left untouched, keeping their
+    mtimes stable for the build tooling's caches.
+    :param file_path: Destination path
+    :param data: File contents as bytes
+    :return: True if the file was written, False if it was already up to date
     """
-    template = """
+    try:
+        if os.stat(file_path).st_size == len(data):
+            with open(file_path, "rb") as file:
+                if file.read() == data:
+                    return False
+    except OSError:
+        pass  # Missing or unreadable; (re)write it below
+
+    # Created with mode 0o666 so the kernel applies the umask, as a plain open() would
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = os.path.join(os.path.dirname(file_path), f".dashcraft-{os.urandom(6).hex()}.tmp")
+        try:
+            fd = os.open(tmp_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+# Cached Component Source
+@functools.lru_cache(maxsize=512)
+def _render_component(name, title):
+    """
+    Renders the encoded React component source for a component name and title.
+    Cached, since configurations often repeat the same components.
+    """
+    return f"""
 import React from 'react';
 
 const {name} = () => {{
@@ -113,134 +284,188 @@ const {name} = () => {{
 }};
 
 export default {name};
+    """.encode()
+
+# React Component Generator
+def generate_component(component, output_dir):
+    """
+    Returns the path and contents of a React component file based on the
+    component configuration.
+    :param component: Dictionary defining the component (type, id, options)
+    :param output_dir: Base output directory for the React project
+    :return: Tuple of the file path and its encoded contents
     """
-    content = template.format(
-        name=component['id'].capitalize(),
-        title=component.get('options', {}).get('title', 'Component')
+    # str() keeps the cache key hashable for list or mapping titles; the output is unchanged
+    content = _render_component(
+        component['id'].capitalize(),
+        str(component.get('options', {}).get('title', 'Component'))
     )
-    file_path = os.path.join(output_dir, "src", "components", f"{component['id']}.js")
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "w") as file:
-        file.write(content)
+    return os.path.join(output_dir, "src", "components", f"{component['id']}.js"), content
 
-# Material-UI Theme Generator
-def generate_theme(theme, output_dir):
+# Material-UI Theme Renderer
+def _render_theme(mode, primary_color, secondary_color):
     """
-    Generates a Material-UI theme file based on the theme configuration.
-    :param theme: Dictionary defining theme options (mode, primaryColor, secondaryColor)
-    :param output_dir: Base output directory for the React project
+    Renders the Material-UI theme source for the given palette.
     """
-    template = """
+    return f"""
 import {{ createTheme }} from '@mui/material/styles';
 
 const theme = createTheme({{
     palette: {{
         mode: '{mode}',
         primary: {{
-            main: '{primaryColor}',
+            main: '{primary_color}',
         }},
         secondary: {{
-            main: '{secondaryColor}',
+            main: '{secondary_color}',
         }},
     }},
 }});
 
 export default theme;
     """
-    content = template.format(
-        mode=theme.get("mode", "light"),
-        primaryColor=theme.get("primaryColor", "#1976d2"),
-        secondaryColor=theme.get("secondaryColor", "#ff4081")
+
+# Material-UI Theme Generator
+def generate_theme(theme, output_dir):
+    """
+    Returns the path and contents of a Material-UI theme file based on the
+    theme configuration.
+    :param theme: Dictionary defining theme options (mode, primaryColor, secondaryColor)
+    :param output_dir: Base output directory for the React project
+    :return: Tuple of the file path and its encoded contents
+    """
+    content = _render_theme(
+        theme.get("mode", "light"),
+        theme.get("primaryColor", "#1976d2"),
+        theme.get("secondaryColor", "#ff4081")
     )
-    file_path = os.path.join(output_dir, "src", "themes", "theme.js")
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "w") as file:
-        file.write(content)
+    return os.path.join(output_dir, "src", "themes", "theme.js"), content.encode()
 
 # React Entry Point Generator
 def generate_index_js(output_dir):
     """
-    Generates the index.js file for the React application.
-    """
-    content = """
-import React from 'react';
-import ReactDOM from 'react-dom';
-import App from './App';
-
-ReactDOM.render(
-    <React.StrictMode>
-        <App />
-    </React.StrictMode>,
-    document.getElementById('root')
-);
+    Returns the path and contents of the index.js file for the React application.
+    :return: Tuple of the file path and its encoded contents
     """
-    file_path = os.path.join(output_dir, "src", "index.js")
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "w") as file:
-        file.write(content)
+    return os.path.join(output_dir, "src", "index.js"), INDEX_JS_CONTENT
 
 # React App Wrapper Generator
 def generate_app_js(output_dir):
     """
-    Generates the App.js file for the React application.
+    Returns the path and contents of the App.js file for the React application.
+    :return: Tuple of the file path and its encoded contents
     """
-    content = """
-import React from 'react';
-import './App.css';
-import ThemeProvider from '@mui/material/styles/ThemeProvider';
-import theme from './themes/theme';
+    return os.path.join(output_dir, "src", "App.js"), APP_JS_CONTENT
 
-function App() {
-    return (
-        <ThemeProvider theme={theme}>
-            <div>
-                <h1>Welcome to DashCraft!</h1>
-                <p>Your dashboard is ready to go.</p>
-            </div>
-        </ThemeProvider>
-    );
-}
+# Package.json Generator
+def generate_package_json(output_dir):
+    """
+    Returns the path and contents of the package.json file for the React application.
+    :return: Tuple of the file path and its encoded contents
+    """
+    return os.path.join(output_dir, "package.json"), PACKAGE_JSON_CONTENT
 
-export default App;
+# Batch File Writer
+def write_files(files):
+    """
+    Writes a batch of generated files. Small batches are written sequentially;
+    larger ones overlap their writes on a thread pool.
+    :param files: Dictionary mapping file paths to their encoded contents
     """
-    file_path = os.path.join(output_dir, "src", "App.js")
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "w") as file:
-        file.write(content)
+    if len(files) < PARALLEL_WRITE_THRESHOLD:
+        for file_path, data in files.items():
+            write_file(file_path, data)
+        return
 
-# Package.json Generator
-def generate_package_json(output_dir):
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as executor:
+        for future in [executor.submit(write_file, *item) for item in files.items()]:
+            future.result()
+
+# Dashboard Generator
+def generate_dashboard(config, output_dir):
     """
-    Generates the package.json file for the React application.
+    Generates all files of a dashboard project from a parsed configuration.
+    Every file is rendered in memory first, then the whole batch is written
+    into the directory structure created up front.
+    :param config: Parsed YAML configuration
+    :param output_dir: Base output directory for the React project
     """
-    content = """
-{
-  "name": "dashcraft-app",
-  "version": "1.0.0",
-  "private": true,
-  "dependencies": {
-    "@mui/material": "^5.0.0",
-    "@emotion/react": "^11.0.0",
-    "@emotion/styled": "^11.0.0",
-    "react": "^18.0.0",
-    "react-dom": "^18.0.0",
-    "react-scripts": "5.0.0"
-  },
-  "scripts": {
-    "start": "react-scripts start",
-    "build": "react-scripts build",
-    "test": "react-scripts test",
-    "eject": "react-scripts eject"
-  }
-}
+    create_project_structure(output_dir)
+    # Keyed by path, so a component id listed twice is written once (last entry wins)
+    files = dict([
+        generate_index_js(output_dir),
+        generate_app_js(output_dir),
+        generate_package_json(output_dir),
+        generate_theme(config.get("theme", {}), output_dir),
+    ])
+    files.update(generate_component(component, output_dir) for component in config.get("components", []))
+    write_files(files)
+
+# Parallel Tree Removal
+def remove_tree_parallel(root):
     """
-    file_path = os.path.join(output_dir, "package.json")
-    with open(file_path, "w") as file:
-        file.write(content)
+    Deletes a directory tree, issuing the unlink calls of each directory on a
+    thread pool. Faster than shutil.rmtree on node_modules-sized trees, where
+    most of the time is spent waiting on the filesystem.
+    :param root: Directory to delete
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-# Main CLI Entry Point
-def main():
-    check_and_resolve_dependencies()
+    def on_error(error):
+        raise error
+
+    with ThreadPoolExecutor(max_workers=PURGE_WORKERS) as executor:
+        for dirpath, dirnames, filenames in os.walk(root, topdown=False, onerror=on_error):
+            # os.walk does not descend into symlinked directories; unlink them like files
+            paths = [os.path.join(dirpath, name) for name in filenames]
+            paths.extend(
+                os.path.join(dirpath, name) for name in dirnames
+                if os.path.islink(os.path.join(dirpath, name))
+            )
+            list(executor.map(os.unlink, paths))
+            os.rmdir(dirpath)
+
+# Dashboard Purger
+def purge_dashboard(target_dir):
+    """
+    Deletes a generated dashboard project. node_modules, which holds nearly all
+    of the files, is removed in parallel; the rest goes through shutil.rmtree.
+    :param target_dir: Path to the dashboard directory
+    :return: True if the dashboard was deleted, False otherwise
+    """
+    import shutil
+
+    if not os.path.isfile(os.path.join(target_dir, "package.json")):
+        print(f"'{target_dir}' does not look like a dashboard project (no package.json). Nothing purged.")
+        return False
+    try:
+        node_modules = os.path.join(target_dir, "node_modules")
+        if os.path.isdir(node_modules) and not os.path.islink(node_modules):
+            remove_tree_parallel(node_modules)
+        shutil.rmtree(target_dir)
+    except OSError as e:
+        print(f"Error purging dashboard: {e}")
+        return False
+    print(f"Dashboard at '{target_dir}' purged successfully.")
+    return True
+
+# Dashboard Creation
+def create_dashboard(config, output_dir):
+    """
+    Generates the dashboard described by a parsed configuration and reports it.
+    :param config: Parsed YAML configuration
+    :param output_dir: Base output directory for the React project
+    """
+    generate_dashboard(config, output_dir)
+    print(f"Dashboard created successfully at '{output_dir}'. Run 'npm install' and 'npm start' to launch.")
+
+# Interactive Menu
+def run_interactive():
+    """
+    Prompts the user for an action and its inputs.
+    """
     print("Welcome to DashCraft! What would you like to do?")
     print("1: Create Dashboard from YAML")
     print("2: Purge Existing Dashboard")
@@ -252,19 +477,43 @@ def main():
         if not config:
             return
         output_dir = input("Enter the output directory for the dashboard (default: './output'): ") or "./output"
-        create_project_structure(output_dir, PROJECT_STRUCTURE)
-        generate_index_js(output_dir)
-        generate_app_js(output_dir)
-        generate_package_json(output_dir)
-        for component in config.get("components", []):
-            generate_component(component, output_dir)
-        generate_theme(config.get("theme", {}), output_dir)
-        print(f"Dashboard created successfully at '{output_dir}'. Run 'npm install' and 'npm start' to launch.")
+        create_dashboard(config, output_dir)
     elif choice == "2":
         target_dir = input("Enter the path to the dashboard directory to purge: ")
         purge_dashboard(target_dir)
     else:
         print("Invalid choice. Exiting.")
 
+# Main CLI Entry Point
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="DashCraft",
+        description="Generate React dashboards from YAML configurations, or purge existing ones. "
+                    "Runs interactively when started from a terminal without arguments."
+    )
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--yaml", metavar="FILE", help="YAML configuration to generate a dashboard from")
+    action.add_argument("--purge", metavar="DIR", help="dashboard directory to purge")
+    parser.add_argument("--output", metavar="DIR",
+                        help="output directory for the generated dashboard (default: ./output)")
+    args = parser.parse_args(argv)
+
+    if args.output is not None and not args.yaml:
+        parser.error("--output can only be used with --yaml")
+    if not args.yaml and not args.purge and not sys.stdin.isatty():
+        parser.error("--yaml or --purge is required when not running interactively")
+
+    check_and_resolve_dependencies()
+    if args.yaml:
+        config = load_yaml(args.yaml)
+        if not config:
+            sys.exit(1)
+        create_dashboard(config, args.output or "./output")
+    elif args.purge:
+        if not purge_dashboard(args.purge):
+            sys.exit(1)
+    else:
+        run_interactive()
+
 if __name__ == "__main__":
     main()
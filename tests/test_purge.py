@@ -0,0 +1,52 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import DashCraft
+
+
+class PurgeDashboardTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.project = os.path.join(self.tmp.name, "dashboard")
+        self.outside = os.path.join(self.tmp.name, "outside")
+        os.makedirs(os.path.join(self.outside, "keep"))
+        with open(os.path.join(self.outside, "keep", "data.txt"), "w") as file:
+            file.write("keep me")
+
+    def purge(self, target_dir):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return DashCraft.purge_dashboard(target_dir)
+
+    def make_project(self):
+        node_modules = os.path.join(self.project, "node_modules")
+        os.makedirs(os.path.join(node_modules, "pkg", "lib"))
+        with open(os.path.join(self.project, "package.json"), "w") as file:
+            file.write("{}")
+        with open(os.path.join(node_modules, "pkg", "lib", "index.js"), "w") as file:
+            file.write("module.exports = {};")
+        return node_modules
+
+    def test_symlinked_directory_is_unlinked_not_followed(self):
+        node_modules = self.make_project()
+        os.symlink(self.outside, os.path.join(node_modules, "linked"), target_is_directory=True)
+        os.symlink(os.path.join(self.tmp.name, "missing"), os.path.join(node_modules, "pkg", "dangling"),
+                   target_is_directory=True)
+
+        self.assertTrue(self.purge(self.project))
+
+        self.assertFalse(os.path.lexists(self.project))
+        with open(os.path.join(self.outside, "keep", "data.txt")) as file:
+            self.assertEqual(file.read(), "keep me")
+
+    def test_refuses_directory_without_package_json(self):
+        self.assertFalse(self.purge(self.outside))
+
+        self.assertTrue(os.path.isfile(os.path.join(self.outside, "keep", "data.txt")))
+
+
+if __name__ == "__main__":
+    unittest.main()